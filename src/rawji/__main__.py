@@ -7,21 +7,102 @@ Full control over film simulations, exposure, tone curve, and more.
 
 Usage:
     rawji input.RAF output.jpg [OPTIONS]
+    rawji --output-dir=DIR input.RAF [input2.RAF | directory ...] [OPTIONS]
 
 Author: Based on petabyt/fudge, libgphoto2, and protocol research
 License: GPL (due to library dependencies)
 """
 
+import os
 import sys
 import argparse
+import functools
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from .fuji_usb import FujiCamera
-from .fuji_profile import create_profile_from_camera, validate_params
+from .fuji_profile import create_profile_from_camera, validate_params, dump_profile
 from .fuji_enums import FilmSimulation, WhiteBalance, DynamicRange, GrainEffect, ChromeEffect
 
 
-def main():
+def _collect_inputs(paths: List[Path]) -> Optional[List[Path]]:
+    """Expand directories to the RAF files they contain, None if a path is missing"""
+    inputs = []
+    for path in paths:
+        if path.is_dir():
+            inputs.extend(sorted(p for p in path.iterdir() if p.suffix.upper() == '.RAF'))
+        elif path.exists():
+            inputs.append(path)
+        else:
+            print(f"[-] Input file not found: {path}")
+            return None
+    return inputs
+
+
+def _prefetch(path: Path):
+    """Have the kernel start reading a file into the page cache in the background"""
+    # Linux/Unix only, elsewhere the upload simply reads from disk
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _convert(camera: FujiCamera, raf: Path, output: Path, profile: bytes) -> int:
+    """Convert one RAF on a connected camera, returns the JPEG size"""
+    # Send RAF file FIRST
+    print("[*] Sending RAF file to camera...")
+    camera.send_raf(raf)
+
+    # Send profile
+    print("[*] Sending profile to camera...")
+    camera.set_profile(profile)
+
+    # Trigger conversion
+    camera.trigger_conversion()
+
+    # Wait for result, streaming the JPEG straight to disk
+    if output.exists() and not output.is_file():
+        # Not a regular file (e.g. /dev/null), write to it directly
+        with output.open('wb') as f:
+            size = camera.wait_for_result(timeout=30, output=f)
+    else:
+        # Download into a temporary file next to the output and only move it
+        # into place once complete, so a failed conversion neither leaves a
+        # truncated JPEG behind nor destroys an existing one
+        partial = output.with_name(output.name + '.part')
+        try:
+            with partial.open('wb') as f:
+                size = camera.wait_for_result(timeout=30, output=f)
+            os.replace(partial, output)
+        except BaseException:
+            try:
+                partial.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+
+    print(f"[+] Saved to {output}")
+
+    # Verify it's actually a JPEG
+    if output.is_file():
+        with output.open('rb') as f:
+            if f.read(3) != b'\xFF\xD8\xFF':
+                print("[!] Warning: Downloaded data doesn't appear to be a JPEG")
+
+    return size
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once, it is reused by every main() call)"""
     parser = argparse.ArgumentParser(
         description='Fujifilm RAW Conversion Tool - Convert RAF files using in-camera processing',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -33,6 +114,9 @@ Examples:
   # With film simulation
   %(prog)s input.RAF output.jpg --film-sim=velvia
 
+  # Batch conversion, one camera session for all files
+  %(prog)s --output-dir=converted/ DSCF0001.RAF DSCF0002.RAF raws/ --film-sim=acros
+
   # Full control
   %(prog)s input.RAF output.jpg \\
       --film-sim=classic-chrome \\
@@ -58,8 +142,20 @@ Requirements:
     )
 
     # Required arguments
-    parser.add_argument('input', type=Path, help='Input RAF file')
-    parser.add_argument('output', type=Path, help='Output JPEG file')
+    parser.add_argument(
+        'files',
+        type=Path,
+        nargs='+',
+        metavar='FILE',
+        help='Input RAF file and output JPEG file, or with --output-dir: '
+             'input RAF files and directories of RAF files'
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        metavar='DIR',
+        help='Convert all inputs in one camera session, writing <name>.jpg to DIR'
+    )
 
     # Film simulation
     parser.add_argument(
@@ -172,143 +268,187 @@ Requirements:
         help='Dump camera profile and exit (no conversion)'
     )
 
-    args = parser.parse_args()
+    return parser
 
-    # Validate input file exists
-    if not args.input.exists():
-        print(f"[-] Input file not found: {args.input}")
-        return 1
 
-    if not args.input.suffix.upper() == '.RAF':
-        print(f"[!] Warning: Input file doesn't have .RAF extension: {args.input}")
+def main(argv: Optional[List[str]] = None):
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    # Pair every input RAF with its output JPEG
+    jobs: List[Tuple[Path, Path]]
+    if args.output_dir:
+        inputs = _collect_inputs(args.files)
+        if inputs is None:
+            return 1
+        if not inputs:
+            print("[-] No RAF files found")
+            return 1
+        jobs = [(raf, args.output_dir / f"{raf.stem}.jpg") for raf in inputs]
+
+        # Inputs with the same name from different directories would
+        # overwrite each other's JPEG
+        sources: Dict[Path, Path] = {}
+        for raf, output in jobs:
+            if output in sources:
+                print(f"[-] {sources[output]} and {raf} would both be written to {output}")
+                return 1
+            sources[output] = raf
+    else:
+        if len(args.files) != 2:
+            parser.error("expected INPUT OUTPUT (use --output-dir to convert several files)")
+        if not args.files[0].exists():
+            print(f"[-] Input file not found: {args.files[0]}")
+            return 1
+        jobs = [(args.files[0], args.files[1])]
+
+    for raf, _ in jobs:
+        if not raf.suffix.upper() == '.RAF':
+            print(f"[!] Warning: Input file doesn't have .RAF extension: {raf}")
 
     # Print header
     print("=" * 70)
     print("Rawji - Fujifilm RAW Conversion Tool")
     print("=" * 70)
-    print(f"Input:  {args.input}")
-    if not args.dump_profile:
-        print(f"Output: {args.output}")
+    if len(jobs) == 1:
+        print(f"Input:  {jobs[0][0]}")
+        if not args.dump_profile:
+            print(f"Output: {jobs[0][1]}")
+    else:
+        print(f"Input:  {len(jobs)} RAF files")
+        if not args.dump_profile:
+            print(f"Output: {args.output_dir}")
     print("=" * 70)
 
-    # Connect to camera
-    camera = FujiCamera()
-    if not camera.connect():
-        return 1
+    # Build parameter changes dictionary
+    # Done before touching the camera, so a bad argument fails fast instead of
+    # after a full RAF upload and nothing but USB I/O runs once connected
+    changes = {}
 
-    try:
-        # Send RAF file FIRST
-        # The camera needs a RAF loaded before it can return a valid profile
-        print("[*] Sending RAF file to camera...")
-        camera.send_raf(str(args.input))
-
-        # Get current profile from camera (we won't use it, just for verification)
-        original_profile = camera.get_profile()
-        print(f"[+] Camera returned {len(original_profile)}-byte profile")
-
-        # Build parameter changes dictionary
-        changes = {}
-
-        # Film simulation
-        if args.film_sim:
-            film_sim = FilmSimulation.from_name(args.film_sim)
-            changes['FilmSimulation'] = int(film_sim)
-            print(f"Film Simulation: {args.film_sim} (0x{film_sim:02X})")
-
-        # Exposure
-        if args.exposure is not None:
-            changes['ExposureBias'] = int(args.exposure * 1000)  # Convert to millistops
-            print(f"Exposure Bias: {args.exposure:+.2f} EV")
-
-        # Tone curve (user provides simple values, encoding handled in create_profile)
-        if args.highlights is not None:
-            changes['HighlightTone'] = args.highlights
-            print(f"Highlight Tone: {args.highlights:+d}")
-
-        if args.shadows is not None:
-            changes['ShadowTone'] = args.shadows
-            print(f"Shadow Tone: {args.shadows:+d}")
-
-        # Color/sharpness
-        if args.color is not None:
-            changes['Color'] = args.color
-            print(f"Color: {args.color:+d}")
-
-        if args.sharpness is not None:
-            changes['Sharpness'] = args.sharpness
-            print(f"Sharpness: {args.sharpness:+d}")
-
-        if args.nr is not None:
-            changes['NoiseReduction'] = args.nr
-            print(f"Noise Reduction: {args.nr:+d}")
-
-        # White balance
-        if args.white_balance:
-            wb = WhiteBalance.from_name(args.white_balance)
-            changes['WhiteBalance'] = int(wb)
-            print(f"White Balance: {args.white_balance}")
-
-        # Dynamic range
-        if args.dynamic_range:
-            dr = DynamicRange.from_percent(args.dynamic_range)
-            changes['DynamicRange'] = int(dr)
-            print(f"Dynamic Range: DR{args.dynamic_range}")
-
-        # Film effects
-        if args.grain:
-            grain = GrainEffect.from_name(args.grain)
-            changes['GrainEffect'] = int(grain)
-            print(f"Grain Effect: {args.grain}")
-
-        if args.color_chrome:
-            chrome = ChromeEffect.from_name(args.color_chrome)
-            changes['ChromeEffect'] = int(chrome)
-            print(f"Color Chrome Effect: {args.color_chrome}")
+    # Film simulation
+    if args.film_sim:
+        film_sim = FilmSimulation.from_name(args.film_sim)
+        changes['FilmSimulation'] = int(film_sim)
+        print(f"Film Simulation: {args.film_sim} (0x{film_sim:02X})")
 
-        print("=" * 70)
+    # Exposure
+    if args.exposure is not None:
+        changes['ExposureBias'] = int(args.exposure * 1000)  # Convert to millistops
+        print(f"Exposure Bias: {args.exposure:+.2f} EV")
 
-        # Validate parameters
-        try:
-            validate_params(
-                film_sim=changes.get('FilmSimulation'),
-                exposure=args.exposure,
-                highlights=changes.get('HighlightTone'),
-                shadows=changes.get('ShadowTone'),
-                color=changes.get('Color'),
-                sharpness=changes.get('Sharpness'),
-            )
-        except ValueError as e:
-            print(f"[-] Parameter validation failed: {e}")
-            return 1
+    # Tone curve (user provides simple values, encoding handled in create_profile)
+    if args.highlights is not None:
+        changes['HighlightTone'] = args.highlights
+        print(f"Highlight Tone: {args.highlights:+d}")
+
+    if args.shadows is not None:
+        changes['ShadowTone'] = args.shadows
+        print(f"Shadow Tone: {args.shadows:+d}")
+
+    # Color/sharpness
+    if args.color is not None:
+        changes['Color'] = args.color
+        print(f"Color: {args.color:+d}")
+
+    if args.sharpness is not None:
+        changes['Sharpness'] = args.sharpness
+        print(f"Sharpness: {args.sharpness:+d}")
+
+    if args.nr is not None:
+        changes['NoiseReduction'] = args.nr
+        print(f"Noise Reduction: {args.nr:+d}")
+
+    if args.clarity is not None:
+        changes['Clarity'] = args.clarity
+        print(f"Clarity: {args.clarity:+d}")
+
+    # White balance
+    if args.white_balance:
+        wb = WhiteBalance.from_name(args.white_balance)
+        changes['WhiteBalance'] = int(wb)
+        print(f"White Balance: {args.white_balance}")
+
+    # Dynamic range
+    if args.dynamic_range:
+        dr = DynamicRange.from_percent(args.dynamic_range)
+        changes['DynamicRange'] = int(dr)
+        print(f"Dynamic Range: DR{args.dynamic_range}")
+
+    # Film effects
+    if args.grain:
+        grain = GrainEffect.from_name(args.grain)
+        changes['GrainEffect'] = int(grain)
+        print(f"Grain Effect: {args.grain}")
+
+    if args.color_chrome:
+        chrome = ChromeEffect.from_name(args.color_chrome)
+        changes['ChromeEffect'] = int(chrome)
+        print(f"Color Chrome Effect: {args.color_chrome}")
+
+    print("=" * 70)
+
+    # Validate parameters and create 628-byte standard format profile
+    # This works for ALL cameras including X-T30! It is built from defaults +
+    # changes, so there is no need to fetch the camera's profile first
+    try:
+        validate_params(
+            film_sim=changes.get('FilmSimulation'),
+            exposure=args.exposure,
+            highlights=changes.get('HighlightTone'),
+            shadows=changes.get('ShadowTone'),
+            color=changes.get('Color'),
+            sharpness=changes.get('Sharpness'),
+            nr=changes.get('NoiseReduction'),
+            clarity=changes.get('Clarity'),
+        )
 
-        # Create 628-byte standard format profile
-        # This works for ALL cameras including X-T30!
         print("\n[*] Creating 628-byte standard format profile...")
-        modified_profile = create_profile_from_camera(original_profile, changes)
+        modified_profile = create_profile_from_camera(b'', changes)
         print(f"[+] Profile created: {len(modified_profile)} bytes")
+    except ValueError as e:
+        print(f"[-] Parameter validation failed: {e}")
+        return 1
+
+    if args.output_dir and not args.dump_profile:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Send profile
-        print("[*] Sending profile to camera...")
-        camera.set_profile(modified_profile)
+    # Let the first RAF load from disk while the camera connects
+    _prefetch(jobs[0][0])
+
+    # Connect to camera once, the session is shared by all conversions
+    camera = FujiCamera()
+    if not camera.connect():
+        return 1
+
+    try:
+        if args.dump_profile:
+            # The camera needs a RAF loaded before it can return a valid profile
+            print("[*] Sending RAF file to camera...")
+            camera.send_raf(jobs[0][0])
 
-        # Trigger conversion
-        camera.trigger_conversion()
+            original_profile = camera.get_profile()
+            print(dump_profile(original_profile))
+            return 0
 
-        # Wait for result
-        jpeg_data = camera.wait_for_result(timeout=30)
+        total_size = 0
+        for index, (raf, output) in enumerate(jobs, 1):
+            if len(jobs) > 1:
+                print(f"\n[{index}/{len(jobs)}] {raf.name}")
 
-        # Verify it's actually a JPEG
-        if not jpeg_data.startswith(b'\xFF\xD8\xFF'):
-            print("[!] Warning: Downloaded data doesn't appear to be a JPEG")
+            # Read the next RAF from disk while this one is on the USB bus
+            if index < len(jobs):
+                _prefetch(jobs[index][0])
 
-        # Save JPEG
-        print(f"[*] Saving to {args.output}...")
-        args.output.write_bytes(jpeg_data)
+            total_size += _convert(camera, raf, output, modified_profile)
 
         # Success!
         print("\n" + "=" * 70)
-        print(f"SUCCESS! Converted {args.input.name} -> {args.output.name}")
-        print(f"Output size: {len(jpeg_data)} bytes ({len(jpeg_data) / 1024 / 1024:.2f} MB)")
+        if len(jobs) == 1:
+            raf, output = jobs[0]
+            print(f"SUCCESS! Converted {raf.name} -> {output.name}")
+        else:
+            print(f"SUCCESS! Converted {len(jobs)} files -> {args.output_dir}")
+        print(f"Output size: {total_size} bytes ({total_size / 1024 / 1024:.2f} MB)")
         print("=" * 70)
 
         return 0
@@ -48,6 +48,23 @@ class PTPResponseCode(IntEnum):
     DevicePropNotSupported = 0x200A
 
 
+class PTPEventCode(IntEnum):
+    """PTP event codes, sent on the interrupt endpoint"""
+    CancelTransaction = 0x4001
+    ObjectAdded = 0x4002
+    ObjectRemoved = 0x4003
+    StoreAdded = 0x4004
+    StoreRemoved = 0x4005
+    DevicePropChanged = 0x4006
+    ObjectInfoChanged = 0x4007
+    DeviceInfoChanged = 0x4008
+    RequestObjectTransfer = 0x4009
+    StoreFull = 0x400A
+    DeviceReset = 0x400B
+    StorageInfoChanged = 0x400C
+    CaptureComplete = 0x400D
+
+
 # ==============================================================================
 # Fujifilm Device Properties
 # ==============================================================================
@@ -57,6 +74,15 @@ PTP_DPC_FUJI_RawConvProfile = 0xD185  # The 605/628-byte d185 profile
 PTP_DPC_FUJI_StartRawConversion = 0xD183  # Trigger conversion (set to 0)
 
 
+# ==============================================================================
+# CLI Name Lookup
+# ==============================================================================
+
+def _lookup_key(name: str) -> str:
+    """Normalize a CLI or member name for lookup ('classic-chrome' -> 'classicchrome')"""
+    return name.replace('-', '').replace('_', '').lower()
+
+
 # ==============================================================================
 # Film Simulations
 # ==============================================================================
@@ -83,19 +109,23 @@ class FilmSimulation(IntEnum):
 
     @classmethod
     def names(cls):
-        """Return list of film simulation names for argparse choices"""
-        return [name.lower().replace('_', '-') for name in cls.__members__.keys()]
+        """Return film simulation names for argparse choices"""
+        return _FILM_SIMULATION_NAMES
 
     @classmethod
     def from_name(cls, name: str):
         """Convert CLI name to enum value"""
         # Convert 'classic-chrome' -> 'ClassicChrome'
         # Need to handle special cases like 'proneghi' -> 'ProNegHi'
-        name_normalized = name.replace('-', '').lower()
-        for member_name in cls.__members__.keys():
-            if member_name.lower() == name_normalized:
-                return cls[member_name]
-        raise ValueError(f"Unknown film simulation: {name}")
+        member = _FILM_SIMULATION_BY_NAME.get(_lookup_key(name))
+        if member is None:
+            raise ValueError(f"Unknown film simulation: {name}")
+        return member
+
+
+# CLI names and name -> member lookup, computed once
+_FILM_SIMULATION_NAMES = tuple(name.lower().replace('_', '-') for name in FilmSimulation.__members__)
+_FILM_SIMULATION_BY_NAME = {_lookup_key(name): member for name, member in FilmSimulation.__members__.items()}
 
 
 # ==============================================================================
@@ -120,14 +150,21 @@ class WhiteBalance(IntEnum):
 
     @classmethod
     def names(cls):
-        """Return list of WB names for argparse choices"""
-        return [name.lower().replace('_', '-') for name in cls.__members__.keys()]
+        """Return WB names for argparse choices"""
+        return _WHITE_BALANCE_NAMES
 
     @classmethod
     def from_name(cls, name: str):
         """Convert CLI name to enum value"""
-        enum_name = name.replace('-', ' ').title().replace(' ', '')
-        return cls[enum_name]
+        member = _WHITE_BALANCE_BY_NAME.get(_lookup_key(name))
+        if member is None:
+            raise ValueError(f"Unknown white balance: {name}")
+        return member
+
+
+# CLI names and name -> member lookup, computed once
+_WHITE_BALANCE_NAMES = tuple(name.lower().replace('_', '-') for name in WhiteBalance.__members__)
+_WHITE_BALANCE_BY_NAME = {_lookup_key(name): member for name, member in WhiteBalance.__members__.items()}
 
 
 # ==============================================================================
@@ -154,14 +191,21 @@ class ImageSize(IntEnum):
 
     @classmethod
     def names(cls):
-        """Return list of size names for argparse choices"""
-        return [name.lower().replace('_', '-') for name in cls.__members__.keys()]
+        """Return size names for argparse choices"""
+        return _IMAGE_SIZE_NAMES
 
     @classmethod
     def from_name(cls, name: str):
         """Convert CLI name to enum value"""
-        enum_name = name.upper().replace('-', '_')
-        return cls[enum_name]
+        member = _IMAGE_SIZE_BY_NAME.get(_lookup_key(name))
+        if member is None:
+            raise ValueError(f"Unknown image size: {name}")
+        return member
+
+
+# CLI names and name -> member lookup, computed once
+_IMAGE_SIZE_NAMES = tuple(name.lower().replace('_', '-') for name in ImageSize.__members__)
+_IMAGE_SIZE_BY_NAME = {_lookup_key(name): member for name, member in ImageSize.__members__.items()}
 
 
 # ==============================================================================
@@ -199,8 +243,8 @@ class GrainEffect(IntEnum):
 
     @classmethod
     def names(cls):
-        """Return list of grain effect names for argparse choices"""
-        return [name.lower() for name in cls.__members__.keys()]
+        """Return grain effect names for argparse choices"""
+        return _GRAIN_EFFECT_NAMES
 
     @classmethod
     def from_name(cls, name: str):
@@ -208,6 +252,10 @@ class GrainEffect(IntEnum):
         return cls[name.capitalize()]
 
 
+# CLI names, computed once
+_GRAIN_EFFECT_NAMES = tuple(name.lower() for name in GrainEffect.__members__)
+
+
 class GrainEffectSize(IntEnum):
     """Film grain size"""
     Small = 0x0
@@ -222,8 +270,8 @@ class ChromeEffect(IntEnum):
 
     @classmethod
     def names(cls):
-        """Return list of chrome effect names for argparse choices"""
-        return [name.lower() for name in cls.__members__.keys()]
+        """Return chrome effect names for argparse choices"""
+        return _CHROME_EFFECT_NAMES
 
     @classmethod
     def from_name(cls, name: str):
@@ -231,6 +279,10 @@ class ChromeEffect(IntEnum):
         return cls[name.capitalize()]
 
 
+# CLI names, computed once
+_CHROME_EFFECT_NAMES = tuple(name.lower() for name in ChromeEffect.__members__)
+
+
 class ColorChromeBlue(IntEnum):
     """Color chrome blue effect"""
     Off = 0x0
@@ -365,6 +417,9 @@ PROFILE_PARAM_INDEX = {
     'HDR': 28,
 }
 
+# Inverse mapping
+PROFILE_INDEX_TO_PARAM = {v: k for k, v in PROFILE_PARAM_INDEX.items()}
+
 # X-T30 specific parameter mapping (605 bytes, offset 0x1D4)
 # The X-T30 uses a different layout with 24 parameters (indices 0-10 are always zero).
 # Values are stored in BYTE 1 of the 32-bit value (not the full 32 bits).
@@ -435,7 +490,6 @@ def get_param_index(name: str) -> int:
 
 def get_param_name(index: int) -> str:
     """Get profile parameter name by index"""
-    for name, idx in PROFILE_PARAM_INDEX.items():
-        if idx == index:
-            return name
-    raise ValueError(f"Unknown parameter index: {index}")
+    if index not in PROFILE_INDEX_TO_PARAM:
+        raise ValueError(f"Unknown parameter index: {index}")
+    return PROFILE_INDEX_TO_PARAM[index]
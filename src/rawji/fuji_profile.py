@@ -11,6 +11,7 @@ CRITICAL FINDINGS:
 Based on: docs/fudge/lib/fp/src/d185.c and docs/fudge/lib/fp/src/fp.h
 """
 
+import functools
 import struct
 from typing import Dict, Optional
 
@@ -30,16 +31,21 @@ PROFILE_PARAMS_OFFSET = 0x201  # Standard format offset (513)
 #   -2 → -20 (FP_MIN_2) = 0xFFFFFFEC
 #   -4 → -40 (FP_MIN_4) = 0xFFFFFFD8
 
+# Lookup table covering the valid tone range (-5 to +5, Clarity being widest)
+_TONE_ENCODE = {value: value * 10 for value in range(-5, 6)}
+
 def encode_tone_value(value: int) -> int:
     """Encode tone parameter value (multiply by 10)"""
-    return value * 10
+    encoded = _TONE_ENCODE.get(value)
+    if encoded is None:
+        raise ValueError(f"Tone value out of range: {value} (must be -5 to +5)")
+    return encoded
 
 def decode_tone_value(encoded: int) -> int:
     """Decode tone parameter value (divide by 10)"""
-    # Handle negative values (two's complement)
-    if encoded > 0x7FFFFFFF:
-        encoded = encoded - 0x100000000
-    return encoded // 10
+    # Accepts both signed and uint32 (two's complement) encoded values, the
+    # offset and mask sign-extend the latter without branching
+    return (((encoded + 0x80000000) & 0xFFFFFFFF) - 0x80000000) // 10
 
 # ==============================================================================
 # Profile Parameter Indices (Standard Format)
@@ -77,112 +83,130 @@ PARAM_INDEX = {
     'Reserved28': 28,
 }
 
-# Inverse mapping
-INDEX_TO_PARAM = {v: k for k, v in PARAM_INDEX.items()}
+# Inverse mapping, parameter names in index order
+INDEX_TO_PARAM = tuple(sorted(PARAM_INDEX, key=PARAM_INDEX.get))
 
 # Parameters that use *10 encoding
-TONE_PARAMS = {'HighlightTone', 'ShadowTone', 'Color', 'Sharpness', 'NoiseReduction', 'Clarity'}
+TONE_PARAMS = frozenset({'HighlightTone', 'ShadowTone', 'Color', 'Sharpness', 'NoiseReduction', 'Clarity'})
+
+# Whether each parameter index uses *10 encoding
+_TONE_MASK = tuple(name in TONE_PARAMS for name in INDEX_TO_PARAM)
+
+# Default parameter values (from get_prop() in d185.c)
+DEFAULT_PARAMS = {
+    'ShootingCondition': 0x2,
+    'FileType': 0x7,
+    'ImageSize': 0x7,        # L 3:2
+    'ImageQuality': 0x2,     # Fine
+    'ExposureBias': 0,
+    'DynamicRange': 0x1,     # DR100
+    'WideDRange': 0,
+    'FilmSimulation': 0x1,   # Provia (default)
+    'GrainEffect': 0,
+    'SmoothSkinEffect': 0,
+    'WBShootCond': 0,
+    'WhiteBalance': 0,       # AsShot
+    'WBShiftR': 0,
+    'WBShiftB': 0,
+    'WBColorTemp': 0,
+    'HighlightTone': 0,
+    'ShadowTone': 0,
+    'Color': 0,
+    'Sharpness': 0,
+    'NoiseReduction': 0,
+    'Clarity': 0,
+    'ColorSpace': 0,
+    'HDR': 0,
+    'DigitalTeleConv': 0,
+    'PortraitEnhancer': 0,
+    'Reserved25': 0,
+    'Reserved26': 0,
+    'Reserved27': 0,
+    'Reserved28': 0,
+}
+
+# Default values in parameter index order
+_DEFAULT_VALUES = tuple(DEFAULT_PARAMS[INDEX_TO_PARAM[i]] for i in range(NUM_PARAMS))
+
+# Header: n_props (uint16) + IOPCode string length in chars (uint8)
+_HEADER_STRUCT = struct.Struct('<HB')
+
+# All 29 parameters as signed int32, packed/unpacked in a single call
+_PARAMS_STRUCT = struct.Struct(f'<{NUM_PARAMS}i')
+
+# Profiles with the header filled in and all parameters zero, per IOPCode
+_BLANK_PROFILES: Dict[str, bytes] = {}
 
 # ==============================================================================
 # Profile Creation
 # ==============================================================================
 
+def _new_profile(iopcode: str) -> bytearray:
+    """Create a profile buffer with the header filled in and all parameters zero"""
+    # The header only depends on the IOPCode, so it is encoded once per
+    # IOPCode and every new profile is a copy of the cached blank one
+    blank = _BLANK_PROFILES.get(iopcode)
+    if blank is None:
+        # Create buffer
+        profile = bytearray(PROFILE_SIZE_STANDARD)
+
+        # Header: n_props = 0x1d (29), followed by the IOPCode string length
+        _HEADER_STRUCT.pack_into(profile, 0, NUM_PARAMS, len(iopcode) + 1)
+
+        # IOPCode string (wide char, null-terminated), encoded in one go
+        # The null terminator is already there, the buffer is zero-filled
+        offset = _HEADER_STRUCT.size
+        encoded = iopcode.encode('utf-16-le')
+        profile[offset:offset + len(encoded)] = encoded
+
+        # No padding needed up to 0x201 (513), bytearray() is already zero-filled
+        blank = _BLANK_PROFILES[iopcode] = bytes(profile)
+
+    return bytearray(blank)
+
+
+def _encode_values(changes: Dict[str, int]) -> list:
+    """Return all parameter values in index order, defaults + encoded changes"""
+    # Apply changes directly by index, encoding tone parameters (multiply by 10)
+    # Names not in the standard format are ignored
+    values = list(_DEFAULT_VALUES)
+    for param_name, value in changes.items():
+        index = PARAM_INDEX.get(param_name)
+        if index is None:
+            continue
+        if _TONE_MASK[index]:
+            value = encode_tone_value(value)
+        values[index] = value
+    return values
+
+
 def create_profile_from_camera(
     camera_profile: bytes,
     changes: Dict[str, int],
     iopcode: str = "FF159502"
-) -> bytes:
+) -> bytearray:
     """
     Create 628-byte standard format profile from camera's profile + changes
 
     Args:
-        camera_profile: Original profile from camera (for extracting base values)
+        camera_profile: Original profile from camera (not read, the profile is
+            built from defaults + changes so b'' is fine)
         changes: Parameter changes (user-friendly values, will be encoded)
         iopcode: Camera IOPCode (default: FF159502 for X-T30)
 
     Returns:
         628-byte standard format profile ready to send to camera
     """
-    # Create buffer
-    profile = bytearray(PROFILE_SIZE_STANDARD)
-
-    # Header: n_props = 0x1d (29)
-    struct.pack_into('<H', profile, 0, NUM_PARAMS)
-
-    # IOPCode string (wide char, null-terminated)
-    offset = 2
-    struct.pack_into('<B', profile, offset, len(iopcode) + 1)
-    offset += 1
-
-    for c in iopcode:
-        struct.pack_into('<H', profile, offset, ord(c))
-        offset += 2
-
-    struct.pack_into('<H', profile, offset, 0)  # null terminator
-    offset += 2
-
-    # Pad to 0x201 (513)
-    while offset < PROFILE_PARAMS_OFFSET:
-        profile[offset] = 0
-        offset += 1
-
-    # Default parameter values (from get_prop() in d185.c)
-    default_params = {
-        'ShootingCondition': 0x2,
-        'FileType': 0x7,
-        'ImageSize': 0x7,        # L 3:2
-        'ImageQuality': 0x2,     # Fine
-        'ExposureBias': 0,
-        'DynamicRange': 0x1,     # DR100
-        'WideDRange': 0,
-        'FilmSimulation': 0x1,   # Provia (default)
-        'GrainEffect': 0,
-        'SmoothSkinEffect': 0,
-        'WBShootCond': 0,
-        'WhiteBalance': 0,       # AsShot
-        'WBShiftR': 0,
-        'WBShiftB': 0,
-        'WBColorTemp': 0,
-        'HighlightTone': 0,
-        'ShadowTone': 0,
-        'Color': 0,
-        'Sharpness': 0,
-        'NoiseReduction': 0,
-        'Clarity': 0,
-        'ColorSpace': 0,
-        'HDR': 0,
-        'DigitalTeleConv': 0,
-        'PortraitEnhancer': 0,
-        'Reserved25': 0,
-        'Reserved26': 0,
-        'Reserved27': 0,
-        'Reserved28': 0,
-    }
-
-    # Apply changes
-    params = default_params.copy()
-    params.update(changes)
-
-    # Encode tone parameters (multiply by 10)
-    for param_name in TONE_PARAMS:
-        if param_name in params:
-            value = params[param_name]
-            params[param_name] = encode_tone_value(value)
+    profile = _new_profile(iopcode)
 
     # Write parameters at offset 0x201
-    for i in range(NUM_PARAMS):
-        param_name = INDEX_TO_PARAM[i]
-        value = params[param_name]
+    # Packed as int32, so negative values end up as two's complement
+    _PARAMS_STRUCT.pack_into(profile, PROFILE_PARAMS_OFFSET, *_encode_values(changes))
 
-        # Convert negative values to uint32 (two's complement)
-        if value < 0:
-            value = (1 << 32) + value
-
-        struct.pack_into('<I', profile, PROFILE_PARAMS_OFFSET + i*4, value)
-
-    return bytes(profile)
+    return profile
 
 
+@functools.lru_cache(maxsize=128)
 def create_profile_simple(
     film_sim: int = 0x1,
     exposure: float = 0.0,
@@ -195,6 +219,9 @@ def create_profile_simple(
     """
     Create profile with simple parameters
 
+    Results are cached, repeated calls with the same settings return the
+    same (immutable) profile.
+
     Args:
         film_sim: Film simulation (1=Provia, 2=Velvia, etc.)
         exposure: Exposure bias in EV (-5.0 to +5.0)
@@ -216,7 +243,7 @@ def create_profile_simple(
         'Sharpness': sharpness,
     }
 
-    return create_profile_from_camera(b'', changes, iopcode)
+    return bytes(create_profile_from_camera(b'', changes, iopcode))
 
 
 # ==============================================================================
@@ -233,24 +260,15 @@ def parse_profile(data: bytes) -> Dict[str, int]:
         # Try parsing X-T30 605-byte format
         return _parse_xt30_format(data)
 
-    params = {}
+    # Read all parameters at offset 0x201 in one call
+    # Unpacked as int32, so two's complement values come out negative
+    values = _PARAMS_STRUCT.unpack_from(data, PROFILE_PARAMS_OFFSET)
 
-    # Read parameters at offset 0x201
-    for i in range(NUM_PARAMS):
-        param_name = INDEX_TO_PARAM[i]
-        value = struct.unpack_from('<I', data, PROFILE_PARAMS_OFFSET + i*4)[0]
-
-        # Convert to signed if negative
-        if value > 0x7FFFFFFF:
-            value = value - 0x100000000
-
-        # Decode tone parameters
-        if param_name in TONE_PARAMS:
-            value = decode_tone_value(value)
-
-        params[param_name] = value
-
-    return params
+    # Decode tone parameters
+    return {
+        param_name: decode_tone_value(value) if is_tone else value
+        for param_name, value, is_tone in zip(INDEX_TO_PARAM, values, _TONE_MASK)
+    }
 
 
 def _parse_xt30_format(data: bytes) -> Dict[str, int]:
@@ -268,6 +286,19 @@ def _parse_xt30_format(data: bytes) -> Dict[str, int]:
 # Helper Functions
 # ==============================================================================
 
+# Parameter ranges checked by validate_params():
+# (argument, label, min, max, value format, allowed range text)
+_PARAM_RANGES = (
+    ('film_sim', 'FilmSimulation', 0x1, 0x11, '0x{:02X}', '0x01-0x11'),
+    ('exposure', 'Exposure', -5.0, 5.0, '{}', '-5.0 to +5.0 EV'),
+    ('highlights', 'Highlights', -4, 4, '{}', '-4 to +4'),
+    ('shadows', 'Shadows', -2, 4, '{}', '-2 to +4 for X-T30'),
+    ('color', 'Color', -4, 4, '{}', '-4 to +4'),
+    ('sharpness', 'Sharpness', -4, 4, '{}', '-4 to +4'),
+    ('nr', 'Noise reduction', -4, 4, '{}', '-4 to +4'),
+    ('clarity', 'Clarity', -5, 5, '{}', '-5 to +5'),
+)
+
 def validate_params(
     film_sim: Optional[int] = None,
     exposure: Optional[float] = None,
@@ -275,49 +306,63 @@ def validate_params(
     shadows: Optional[int] = None,
     color: Optional[int] = None,
     sharpness: Optional[int] = None,
+    nr: Optional[int] = None,
+    clarity: Optional[int] = None,
 ) -> None:
     """Validate parameter ranges"""
+    values = {
+        'film_sim': film_sim,
+        'exposure': exposure,
+        'highlights': highlights,
+        'shadows': shadows,
+        'color': color,
+        'sharpness': sharpness,
+        'nr': nr,
+        'clarity': clarity,
+    }
 
-    if film_sim is not None and (film_sim < 0x1 or film_sim > 0x11):
-        raise ValueError(f"FilmSimulation out of range: 0x{film_sim:02X} (must be 0x01-0x11)")
+    for name, label, min_val, max_val, value_fmt, allowed in _PARAM_RANGES:
+        value = values[name]
+        if value is not None and not min_val <= value <= max_val:
+            raise ValueError(f"{label} out of range: {value_fmt.format(value)} (must be {allowed})")
 
-    if exposure is not None and (exposure < -5.0 or exposure > 5.0):
-        raise ValueError(f"Exposure out of range: {exposure} (must be -5.0 to +5.0 EV)")
 
-    if highlights is not None and (highlights < -4 or highlights > 4):
-        raise ValueError(f"Highlights out of range: {highlights} (must be -4 to +4)")
+def _format_film_sim(value: int) -> str:
+    return f"0x{value:02X}"
 
-    # X-T30 shadow tone is limited to -2 to +4
-    if shadows is not None and (shadows < -2 or shadows > 4):
-        raise ValueError(f"Shadows out of range: {shadows} (must be -2 to +4 for X-T30)")
 
-    if color is not None and (color < -4 or color > 4):
-        raise ValueError(f"Color out of range: {color} (must be -4 to +4)")
+def _format_exposure(value: int) -> str:
+    return f"{value:6d} ({value / 1000.0:+.2f} EV)"
 
-    if sharpness is not None and (sharpness < -4 or sharpness > 4):
-        raise ValueError(f"Sharpness out of range: {sharpness} (must be -4 to +4)")
+
+def _format_tone(value: int) -> str:
+    return f"{value:+3d}"
+
+
+def _row_formatter(param_name: str, is_tone: bool):
+    """Pick the dump_profile() value formatter for a parameter"""
+    if param_name == 'FilmSimulation':
+        return _format_film_sim
+    if param_name == 'ExposureBias':
+        return _format_exposure
+    if is_tone:
+        return _format_tone
+    return str
+
+
+# dump_profile() rows: label and value formatter per parameter index
+_ROW_FORMATTERS = tuple(
+    (f"{i:2d}. {param_name:25s} = ", _row_formatter(param_name, is_tone))
+    for i, (param_name, is_tone) in enumerate(zip(INDEX_TO_PARAM, _TONE_MASK))
+)
 
 
 def dump_profile(profile: bytes) -> str:
     """Dump profile in human-readable format"""
-    params = parse_profile(profile)
-
-    lines = []
-    lines.append(f"Profile size: {len(profile)} bytes")
-    lines.append("=" * 60)
-
-    for i in range(NUM_PARAMS):
-        param_name = INDEX_TO_PARAM[i]
-        value = params.get(param_name, 0)
-
-        if param_name == 'FilmSimulation':
-            lines.append(f"{i:2d}. {param_name:25s} = 0x{value:02X}")
-        elif param_name == 'ExposureBias':
-            ev = value / 1000.0
-            lines.append(f"{i:2d}. {param_name:25s} = {value:6d} ({ev:+.2f} EV)")
-        elif param_name in TONE_PARAMS:
-            lines.append(f"{i:2d}. {param_name:25s} = {value:+3d}")
-        else:
-            lines.append(f"{i:2d}. {param_name:25s} = {value}")
-
-    return "\n".join(lines)
+    # Parameters come back in index order, or not at all for formats that
+    # aren't parsed (shown as zeros)
+    values = parse_profile(profile).values() or (0,) * NUM_PARAMS
+
+    rows = (label + format_value(value) for (label, format_value), value in zip(_ROW_FORMATTERS, values))
+
+    return "\n".join((f"Profile size: {len(profile)} bytes", "=" * 60, *rows))
@@ -9,25 +9,53 @@ Based on:
 - docs/fudge/lib/fuji_usb.c (RAW conversion workflow)
 """
 
+import os
 import struct
+import sys
 import time
 import usb.core
 import usb.util
-from typing import Optional, Tuple
+from typing import BinaryIO, Optional, Tuple, Union
 from .fuji_enums import (
     PTPOperation,
     PTPResponseCode,
+    PTPEventCode,
     PTP_DPC_FUJI_RawConvProfile,
     PTP_DPC_FUJI_StartRawConversion,
     FUJIFILM_USB_VENDOR_ID,
     FUJIFILM_CAMERA_PIDS,
 )
 
+# Bulk transfer chunk sizes
+# Based on libpict transport.c ptp_send_packet()
+BULK_CHUNK_SIZE = 512 * 1024  # 512KB chunks (USB 2.0, 512-byte packets)
+BULK_CHUNK_SIZE_SUPERSPEED = 1024 * 1024  # 1MB chunks (USB 3.x, 1024-byte packets)
+
+# Environment variable overriding the chunk size (in bytes), the optimum is
+# OS and host controller dependent
+BULK_CHUNK_ENV = 'RAWJI_BULK_CHUNK'
+
 
 # ==============================================================================
 # PTP Container Structure (USB variant)
 # ==============================================================================
 
+# Container header: length(4) + type(2) + code(2) + trans_id(4) = 12 bytes
+_PTP_HEADER = struct.Struct('<IHHI')
+
+# Container parameters, 0-5 of them, indexed by count
+_PTP_PARAMS = tuple(struct.Struct('<' + 'I' * n) for n in range(6))
+
+# COMMAND containers, header followed by 0-5 parameters, indexed by count
+_PTP_COMMAND = tuple(struct.Struct('<IHHI' + 'I' * n) for n in range(6))
+
+# ObjectInfo dataset, fixed-size fields before the strings (52 bytes):
+# StorageID, ObjectFormat, ProtectionStatus, CompressedSize, ThumbFormat,
+# ThumbCompressedSize, ThumbPixWidth, ThumbPixHeight, ImagePixWidth,
+# ImagePixHeight, ImageBitDepth, ParentObject, AssociationType,
+# AssociationDesc, SequenceNumber
+_OBJECT_INFO_STRUCT = struct.Struct('<IHHIHIIIIIIIHII')
+
 class PTPContainer:
     """PTP container for USB bulk transfer (different from PTP/IP)"""
 
@@ -37,31 +65,36 @@ class PTPContainer:
     RESPONSE = 0x0003
     EVENT = 0x0004
 
-    def __init__(self, container_type: int, code: int, transaction_id: int, params: list = None, data: bytes = None):
+    def __init__(self, container_type: int, code: int, transaction_id: int, params: list = None, data: bytes = None,
+                 length: int = None):
         self.type = container_type
         self.code = code
         self.transaction_id = transaction_id
         self.params = params or []
         self.data = data or b''
+        self.length = length  # Length from the header, for received containers
 
-    def pack(self) -> bytes:
-        """Pack container into bytes for USB transmission"""
+    def pack_header(self) -> bytearray:
+        """Pack header and parameters, with the length also covering the data"""
         # Header: length(4) + type(2) + code(2) + trans_id(4) = 12 bytes
         # Followed by up to 5 parameters (4 bytes each)
-        # Followed by data (if any)
+        params = self.params[:5]  # Max 5 parameters
+        data_offset = 12 + 4 * len(params)
+        total_length = data_offset + len(self.data)
 
-        params_bytes = b''
-        for param in self.params[:5]:  # Max 5 parameters
-            params_bytes += struct.pack('<I', param)
+        header = bytearray(data_offset)
+        _PTP_HEADER.pack_into(header, 0, total_length, self.type, self.code, self.transaction_id)
+        _PTP_PARAMS[len(params)].pack_into(header, 12, *params)
 
-        total_length = 12 + len(params_bytes) + len(self.data)
+        return header
 
-        header = struct.pack('<I', total_length)  # Length
-        header += struct.pack('<H', self.type)  # Type
-        header += struct.pack('<H', self.code)  # Code
-        header += struct.pack('<I', self.transaction_id)  # Transaction ID
+    def pack(self) -> bytearray:
+        """Pack container into bytes for USB transmission"""
+        # Header and parameters, followed by data (if any)
+        packet = self.pack_header()
+        packet += self.data
 
-        return header + params_bytes + self.data
+        return packet
 
     @classmethod
     def unpack(cls, data: bytes):
@@ -69,25 +102,29 @@ class PTPContainer:
         if len(data) < 12:
             raise ValueError(f"Container too short: {len(data)} bytes")
 
-        length, container_type, code, trans_id = struct.unpack('<IHHI', data[:12])
+        length, container_type, code, trans_id = _PTP_HEADER.unpack_from(data, 0)
 
         # Parse parameters and payload
-        params_data = data[12:]
         params = []
         payload = b''
 
         if container_type == cls.DATA:
             # DATA containers have NO parameters, everything after header is payload
-            payload = params_data
-        elif container_type == cls.RESPONSE:
-            # RESPONSE containers can have up to 5 parameters, NO payload
-            while len(params_data) >= 4 and len(params) < 5:
-                param = struct.unpack('<I', params_data[:4])[0]
-                params.append(param)
-                params_data = params_data[4:]
+            payload = data[12:]
+        elif container_type in (cls.RESPONSE, cls.EVENT):
+            # RESPONSE and EVENT containers can have up to 5 parameters, NO payload
+            num_params = min((len(data) - 12) // 4, 5)
+            params = list(_PTP_PARAMS[num_params].unpack_from(data, 12))
         # COMMAND containers are only sent, never received, so we don't handle them here
 
-        return cls(container_type, code, trans_id, params, payload)
+        return cls(container_type, code, trans_id, params, payload, length)
+
+
+def _pack_command(opcode: int, trans_id: int, params: list) -> bytes:
+    """Pack a COMMAND container without building a PTPContainer"""
+    params = params[:5]  # Max 5 parameters
+    return _PTP_COMMAND[len(params)].pack(12 + 4 * len(params), PTPContainer.COMMAND,
+                                          opcode, trans_id, *params)
 
 
 # ==============================================================================
@@ -105,6 +142,9 @@ class FujiCamera:
         self.session_id = 0x00000001
         self.transaction_id = 0
         self.timeout = 5000  # 5 seconds default
+        self.bulk_chunk = BULK_CHUNK_SIZE  # Bulk transfer chunk size in bytes
+        self._tx_buf = None  # Reusable bulk OUT transfer buffer
+        self._rx_buf = None  # Reusable bulk IN transfer buffer
 
     def find_camera(self) -> Optional[usb.core.Device]:
         """Find Fujifilm camera on USB"""
@@ -175,6 +215,11 @@ class FujiCamera:
 
         print(f"[+] Endpoints: OUT=0x{self.ep_out.bEndpointAddress:02X}, IN=0x{self.ep_in.bEndpointAddress:02X}")
 
+        self.bulk_chunk = self._select_bulk_chunk()
+        print(f"[+] Bulk transfer chunk: {self.bulk_chunk // 1024} KB")
+
+        self._alloc_buffers()
+
         # Open PTP session
         return self.open_session()
 
@@ -193,59 +238,172 @@ class FujiCamera:
 
             self.dev = None
 
+        self._tx_buf = None
+        self._rx_buf = None
+
         print("[+] Disconnected from camera")
 
-    def _next_transaction_id(self) -> int:
-        """Generate next transaction ID"""
-        self.transaction_id += 1
-        return self.transaction_id
+    def _select_bulk_chunk(self) -> int:
+        """Pick the bulk transfer chunk size for the connected endpoints"""
+        max_packet = max(self.ep_in.wMaxPacketSize, self.ep_out.wMaxPacketSize)
 
-    def _send_container(self, container: PTPContainer):
-        """Send PTP container via USB bulk OUT with chunking for large transfers"""
-        data = container.pack()
+        if max_packet >= 1024:
+            chunk = BULK_CHUNK_SIZE_SUPERSPEED
+        else:
+            chunk = BULK_CHUNK_SIZE
 
-        # Chunk large transfers to avoid USB memory issues
-        # Based on libpict transport.c ptp_send_packet()
-        max_chunk_size = 512 * 1024  # 512KB chunks
-        offset = 0
-        total = len(data)
+        override = os.environ.get(BULK_CHUNK_ENV)
+        if override:
+            try:
+                chunk = int(override, 0)
+            except ValueError:
+                print(f"[!] Ignoring invalid {BULK_CHUNK_ENV}={override!r}")
 
-        try:
-            while offset < total:
-                chunk_size = min(max_chunk_size, total - offset)
-                chunk = data[offset:offset + chunk_size]
-                self.ep_out.write(chunk, timeout=self.timeout)
-                offset += chunk_size
-        except Exception as e:
-            raise IOError(f"USB write failed: {e}")
+        # Keep chunks a whole number of packets, so only the final transfer of
+        # a container can end in a short packet
+        return max(max_packet, chunk - chunk % max_packet)
 
-    def _recv_container(self) -> PTPContainer:
-        """Receive PTP container via USB bulk IN, handling multi-packet transfers"""
-        try:
-            # Read first chunk to get container length
-            first_chunk = self.ep_in.read(512 * 1024, timeout=self.timeout)
-            data = bytearray(first_chunk)
+    def _alloc_buffers(self):
+        """Allocate the bulk transfer buffers reused for every USB transfer"""
+        # pyusb hands array('B') buffers straight to libusb, anything else is
+        # converted into a freshly allocated array on every single transfer
+        self._tx_buf = usb.util.create_buffer(self.bulk_chunk)
+        self._rx_buf = usb.util.create_buffer(self.bulk_chunk)
 
-            # Parse container header to get total length
-            if len(data) < 12:
-                raise IOError(f"Container too short: {len(data)} bytes")
+    def _next_transaction_id(self) -> int:
+        """Generate next transaction ID"""
+        self.transaction_id += 1
+        return self.transaction_id
+
+    def _send_command(self, opcode: int, trans_id: int, params: list):
+        """Send a COMMAND container via USB bulk OUT"""
+        self._send_chunked(_pack_command(opcode, trans_id, params), 0, None)
+
+    def _send_data(self, opcode: int, trans_id: int, data: bytes):
+        """Send a DATA container via USB bulk OUT with chunking for large transfers"""
+        # Only the header is packed, the payload is copied straight from data
+        # into the transfer buffer
+        with memoryview(data) as view:
+            offset = 0
+
+            def read_into(dest: memoryview) -> int:
+                nonlocal offset
+                size = len(dest)
+                dest[:] = view[offset:offset + size]
+                offset += size
+                return size
+
+            header = _PTP_HEADER.pack(12 + len(view), PTPContainer.DATA, opcode, trans_id)
+            self._send_chunked(header, len(view), read_into)
+
+    def _send_stream(self, opcode: int, trans_id: int, fileobj: BinaryIO, total_len: int):
+        """Send a DATA container whose payload is read from fileobj as it is sent"""
+        header = _PTP_HEADER.pack(12 + total_len, PTPContainer.DATA, opcode, trans_id)
+        self._send_chunked(header, total_len, fileobj.readinto)
+
+    def _send_chunked(self, header: bytes, payload_size: int, read_into):
+        """
+        Write header + payload to bulk OUT in transfer buffer sized chunks
 
-            total_length = struct.unpack('<I', data[:4])[0]
+        read_into(view) fills the start of view with the next payload bytes
+        and returns how many it wrote.
+        """
+        # Chunk large transfers to avoid USB memory issues, staging each chunk
+        # in the transfer buffer so pyusb can pass it to libusb as-is
+        buf = self._tx_buf
+        buf_size = len(buf)
+        buf_view = memoryview(buf)
+
+        # The header shares the first chunk with the payload, a separate short
+        # header transfer would end the USB transfer early
+        filled = len(header)
+        buf_view[:filled] = header
+        remaining = payload_size
+
+        while True:
+            if remaining:
+                n = read_into(buf_view[filled:filled + min(buf_size - filled, remaining)])
+                if not n:
+                    # Not a USB error, e.g. the file shrank since its size was sent
+                    raise IOError(f"Payload ended {remaining} bytes early")
+                filled += n
+                remaining -= n
+
+                # Short reads from a file just mean another read
+                if remaining and filled < buf_size:
+                    continue
 
-            # Read remaining packets if needed
-            while len(data) < total_length:
-                chunk = self.ep_in.read(512 * 1024, timeout=self.timeout)
-                data.extend(chunk)
+            try:
+                self.ep_out.write(buf if filled == buf_size else buf[:filled], timeout=self.timeout)
+            except Exception as e:
+                raise IOError(f"USB write failed: {e}")
+            filled = 0
 
-                # Safety check to avoid infinite loops
-                if len(data) > 100 * 1024 * 1024:  # 100MB limit
-                    raise IOError(f"Container too large: {len(data)} bytes")
+            if not remaining:
+                break
 
-            return PTPContainer.unpack(bytes(data))
+    def _read_chunk(self) -> int:
+        """Read one bulk IN transfer into the receive buffer, returns its length"""
+        try:
+            return self.ep_in.read(self._rx_buf, timeout=self.timeout)
         except Exception as e:
             raise IOError(f"USB read failed: {e}")
 
-    def send_command(self, opcode: int, params: list = None) -> Tuple[int, list, bytes]:
+    def _recv_container(self, sink: Optional[BinaryIO] = None) -> PTPContainer:
+        """
+        Receive PTP container via USB bulk IN, handling multi-packet transfers
+
+        If sink is given, the payload of a DATA container is written to it as
+        it arrives instead of being collected in memory. Errors writing to the
+        sink are raised as they are, not as USB errors.
+        """
+        # Read first chunk to get container length
+        rx_view = memoryview(self._rx_buf)
+        n = self._read_chunk()
+
+        # Parse container header to get total length
+        if n < 12:
+            raise IOError(f"USB read failed: Container too short: {n} bytes")
+
+        total_length, container_type = struct.unpack_from('<IH', self._rx_buf, 0)
+
+        if sink is not None and container_type == PTPContainer.DATA:
+            header = bytes(rx_view[:12])
+            sink.write(rx_view[12:n])
+            received = n
+            while received < total_length:
+                n = self._read_chunk()
+                sink.write(rx_view[:n])
+                received += n
+
+            return PTPContainer.unpack(header)
+
+        # Safety check to avoid allocating for a bogus length
+        if total_length > 100 * 1024 * 1024:  # 100MB limit
+            raise IOError(f"USB read failed: Container too large: {total_length} bytes")
+
+        # Allocate the whole container once and fill it in place
+        data = bytearray(max(total_length, n))
+        data[:n] = rx_view[:n]
+        received = n
+
+        # Read remaining packets if needed
+        while received < total_length:
+            n = self._read_chunk()
+            data[received:received + n] = rx_view[:n]
+            received += n
+
+        if container_type != PTPContainer.DATA:
+            return PTPContainer.unpack(data)
+
+        # Strip the header in place instead of copying the payload out,
+        # bytearray drops leading bytes without moving the rest
+        container = PTPContainer.unpack(data[:12])
+        del data[:12]
+        container.data = data
+        return container
+
+    def send_command(self, opcode: int, params: list = None) -> Tuple[int, list, bytearray]:
         """
         Send PTP command and receive response
 
@@ -257,13 +415,12 @@ class FujiCamera:
         trans_id = self._next_transaction_id()
 
         # Send command container
-        cmd = PTPContainer(PTPContainer.COMMAND, opcode, trans_id, params)
-        self._send_container(cmd)
+        self._send_command(opcode, trans_id, params)
 
         # Receive response (might be DATA or RESPONSE)
         resp = self._recv_container()
 
-        data = b''
+        data = bytearray()
         if resp.type == PTPContainer.DATA:
             # Data phase - extract data then wait for response
             data = resp.data
@@ -283,12 +440,10 @@ class FujiCamera:
         trans_id = self._next_transaction_id()
 
         # Send command container
-        cmd = PTPContainer(PTPContainer.COMMAND, opcode, trans_id, params)
-        self._send_container(cmd)
+        self._send_command(opcode, trans_id, params)
 
         # Send data container
-        data_cont = PTPContainer(PTPContainer.DATA, opcode, trans_id, data=data)
-        self._send_container(data_cont)
+        self._send_data(opcode, trans_id, data)
 
         # Receive response
         resp = self._recv_container()
@@ -298,6 +453,26 @@ class FujiCamera:
 
         return (resp.code, resp.params)
 
+    def send_stream_command(self, opcode: int, params: list, fileobj: BinaryIO,
+                            size: int) -> Tuple[int, list]:
+        """
+        Send PTP command with a data phase of size bytes read from fileobj
+
+        Returns: (response_code, response_params)
+        """
+        trans_id = self._next_transaction_id()
+
+        self._send_command(opcode, trans_id, params)
+
+        self._send_stream(opcode, trans_id, fileobj, size)
+
+        resp = self._recv_container()
+
+        if resp.type != PTPContainer.RESPONSE:
+            raise IOError(f"Expected RESPONSE, got container type 0x{resp.type:04X}")
+
+        return (resp.code, resp.params)
+
     # ==========================================================================
     # PTP Session Management
     # ==========================================================================
@@ -345,85 +520,63 @@ class FujiCamera:
     # RAW Conversion Operations
     # ==========================================================================
 
-    def send_raf(self, filepath: str):
+    def send_raf(self, raf: Union[str, os.PathLike, bytes]):
         """
         Upload RAF file to camera using Fujifilm vendor-specific commands
 
         Uses operations 0x900C (SendObjectInfo) and 0x900D (SendObject2)
         Based on fudge library: fuji_send_raf() in fuji_usb.c
-        """
-        print(f"[*] Sending RAF file: {filepath}")
-
-        with open(filepath, 'rb') as f:
-            raf_data = f.read()
-
-        print(f"[*] RAF file size: {len(raf_data)} bytes ({len(raf_data) / 1024 / 1024:.1f} MB)")
-
-        # Build ObjectInfo structure - use proper PTP ObjectInfo format!
-        # Based on actual C code: fuji_send_raf() in fuji_usb.c line 307-310
-        object_info = bytearray()
-
-        # StorageID (uint32) = 0
-        object_info += struct.pack('<I', 0)
 
-        # ObjectFormat (uint16) = 0xf802 (NOT 0x5000!)
-        object_info += struct.pack('<H', 0xf802)
-
-        # ProtectionStatus (uint16) = 0
-        object_info += struct.pack('<H', 0)
-
-        # CompressedSize (uint32) = file_size
-        object_info += struct.pack('<I', len(raf_data))
-
-        # ThumbFormat (uint16) = 0
-        object_info += struct.pack('<H', 0)
-
-        # ThumbCompressedSize (uint32) = 0
-        object_info += struct.pack('<I', 0)
-
-        # ThumbPixWidth (uint32) = 0
-        object_info += struct.pack('<I', 0)
-
-        # ThumbPixHeight (uint32) = 0
-        object_info += struct.pack('<I', 0)
+        Args:
+            raf: Path to the RAF file, or the RAF data as a bytes-like object
+        """
+        if isinstance(raf, (str, os.PathLike)):
+            print(f"[*] Sending RAF file: {raf}")
 
-        # ImagePixWidth (uint32) = 0
-        object_info += struct.pack('<I', 0)
+            # Unbuffered, so the upload reads the file straight into the USB
+            # transfer buffer without holding a copy of it in memory
+            with open(raf, 'rb', buffering=0) as f:
+                raf_size = os.fstat(f.fileno()).st_size
+                self._send_object_info(raf_size)
 
-        # ImagePixHeight (uint32) = 0
-        object_info += struct.pack('<I', 0)
+                print("[*] Sending RAF data (Fuji SendObject2, 0x900D)...")
+                code, params = self.send_stream_command(0x900D, [], f, raf_size)
+        else:
+            self._send_object_info(len(raf))
 
-        # ImageBitDepth (uint32) = 0
-        object_info += struct.pack('<I', 0)
+            print("[*] Sending RAF data (Fuji SendObject2, 0x900D)...")
+            code, params = self.send_data_command(0x900D, [], raf)
 
-        # ParentObject (uint32) = 0
-        object_info += struct.pack('<I', 0)
+        if code != PTPResponseCode.OK:
+            raise IOError(f"SendObject failed: 0x{code:04X}")
 
-        # AssociationType (uint16) = 0
-        object_info += struct.pack('<H', 0)
+        print("[+] RAF file sent successfully")
 
-        # AssociationDesc (uint32) = 0
-        object_info += struct.pack('<I', 0)
+    def _send_object_info(self, raf_size: int):
+        """Announce a RAF upload of raf_size bytes with SendObjectInfo"""
+        print(f"[*] RAF file size: {raf_size} bytes ({raf_size / 1024 / 1024:.1f} MB)")
 
-        # SequenceNumber (uint32) = 0
-        object_info += struct.pack('<I', 0)
+        # Build ObjectInfo structure - use proper PTP ObjectInfo format!
+        # Based on actual C code: fuji_send_raf() in fuji_usb.c line 307-310
+        object_info = bytearray(_OBJECT_INFO_STRUCT.pack(
+            0,               # StorageID
+            0xf802,          # ObjectFormat (NOT 0x5000!)
+            0,               # ProtectionStatus
+            raf_size,        # CompressedSize = file_size
+            0, 0, 0, 0,      # ThumbFormat, ThumbCompressedSize, ThumbPixWidth, ThumbPixHeight
+            0, 0, 0,         # ImagePixWidth, ImagePixHeight, ImageBitDepth
+            0,               # ParentObject
+            0, 0,            # AssociationType, AssociationDesc
+            0,               # SequenceNumber
+        ))
 
         # Filename (PTP string) - "FUP_FILE.dat"
         filename = "FUP_FILE.dat"
-        filename_len = len(filename) + 1  # Include null terminator
-        object_info += struct.pack('B', filename_len)
-        for char in filename:
-            object_info += struct.pack('<H', ord(char))
-        object_info += struct.pack('<H', 0)  # Null terminator
-
-        # CaptureDate (empty PTP string)
-        object_info += struct.pack('B', 0)
+        object_info.append(len(filename) + 1)  # Include null terminator
+        object_info += (filename + '\0').encode('utf-16-le')
 
-        # ModificationDate (empty PTP string)
-        object_info += struct.pack('B', 0)
-
-        # Keywords (empty PTP string)
-        object_info += struct.pack('B', 0)
+        # CaptureDate, ModificationDate, Keywords (empty PTP strings)
+        object_info += b'\x00\x00\x00'
 
         print(f"[*] ObjectInfo size: {len(object_info)} bytes")
 
@@ -433,7 +586,7 @@ class FujiCamera:
         code, params = self.send_data_command(
             0x900C,  # PTP_OC_FUJI_SendObjectInfo
             [0, 0, 0],  # storage_id, handle, 0 (3 params for Fuji variant!)
-            bytes(object_info)
+            object_info
         )
 
         if code != PTPResponseCode.OK:
@@ -441,21 +594,7 @@ class FujiCamera:
 
         print("[+] Object info sent")
 
-        # Step 2: Send RAF data using Fuji vendor command 0x900D
-        # The C code calls fuji_send_object_ex() which uses PTP_OC_FUJI_SendObject2
-        print("[*] Sending RAF data (Fuji SendObject2, 0x900D)...")
-        code, params = self.send_data_command(
-            0x900D,  # PTP_OC_FUJI_SendObject2
-            [],  # No parameters
-            raf_data
-        )
-
-        if code != PTPResponseCode.OK:
-            raise IOError(f"SendObject failed: 0x{code:04X}")
-
-        print("[+] RAF file sent successfully")
-
-    def get_profile(self) -> bytes:
+    def get_profile(self) -> bytearray:
         """Get RAW conversion profile from camera (property 0xD185)"""
         print("[*] Getting RAW profile from camera...")
 
@@ -474,14 +613,14 @@ class FujiCamera:
 
         return data
 
-    def set_profile(self, profile: bytes):
+    def set_profile(self, profile: Union[bytes, bytearray]):
         """Send modified RAW profile to camera (property 0xD185)"""
         print(f"[*] Sending modified profile ({len(profile)} bytes)...")
 
         # Debug: Check FilmSimulation value in profile being sent
         if len(profile) >= 500:  # 468 + 7*4 + 4
             offset = 468 + 7 * 4
-            film_sim = struct.unpack('<I', profile[offset:offset+4])[0]
+            film_sim = struct.unpack_from('<I', profile, offset)[0]
             print(f"    DEBUG: FilmSimulation in profile = 0x{film_sim:02X}")
 
         code, params = self.send_data_command(
@@ -499,6 +638,10 @@ class FujiCamera:
         """Trigger RAW conversion (set property 0xD183 to 0)"""
         print("[*] Triggering RAW conversion...")
 
+        # Events queued before the trigger (RAF upload, earlier conversions)
+        # must not be mistaken for this conversion's result
+        self._drain_events()
+
         # Value is just uint16 = 0
         data = struct.pack('<H', 0)
 
@@ -513,62 +656,169 @@ class FujiCamera:
 
         print("[+] Conversion started")
 
-    def wait_for_result(self, timeout: int = 30) -> bytes:
+    def _download_object(self, handle: int, output: BinaryIO) -> Tuple[int, int]:
+        """
+        GetObject with the data phase streamed to output
+
+        Returns: (response_code, object_size)
+        """
+        trans_id = self._next_transaction_id()
+
+        # Send command container
+        self._send_command(PTPOperation.GetObject, trans_id, [handle])
+
+        # Receive response (might be DATA or RESPONSE)
+        resp = self._recv_container(output)
+
+        size = 0
+        if resp.type == PTPContainer.DATA:
+            size = resp.length - 12
+            resp = self._recv_container()
+
+        if resp.type != PTPContainer.RESPONSE:
+            raise IOError(f"Expected RESPONSE, got container type 0x{resp.type:04X}")
+
+        return (resp.code, size)
+
+    def _get_object(self, handle: int, output: Optional[BinaryIO]) -> Tuple[int, Union[bytearray, int]]:
         """
-        Poll for converted JPEG and download it
+        Download an object, streamed to output if given
+
+        Returns: (response_code, object data, or its size if output is given)
+        """
+        print("[*] Downloading JPEG...")
+
+        if output is not None:
+            return self._download_object(handle, output)
+
+        code, params, data = self.send_command(PTPOperation.GetObject, [handle])
+        return (code, data)
+
+    def _drain_events(self):
+        """Discard events already queued on the interrupt endpoint"""
+        if self.ep_int is None:
+            return
+
+        # Bounded, in case the camera keeps sending events
+        for _ in range(64):
+            try:
+                self.ep_int.read(self.ep_int.wMaxPacketSize, timeout=10)
+            except usb.core.USBError:
+                # Timeout, nothing (more) queued
+                return
+
+    def _wait_for_object_added(self, timeout: float) -> Optional[int]:
+        """
+        Wait for an ObjectAdded event on the interrupt endpoint
+
+        Returns the new object's handle, or None if no event arrived in time
+        """
+        if self.ep_int is None:
+            return None
+
+        deadline = time.time() + timeout
+
+        while True:
+            remaining = int((deadline - time.time()) * 1000)
+            if remaining <= 0:
+                return None
+
+            try:
+                data = self.ep_int.read(self.ep_int.wMaxPacketSize, timeout=remaining)
+            except usb.core.USBError:
+                # Timeout, or the camera doesn't report events
+                return None
+
+            if len(data) < 12:
+                continue
+
+            event = PTPContainer.unpack(data)
+            if event.type == PTPContainer.EVENT and event.code == PTPEventCode.ObjectAdded and event.params:
+                return event.params[0]
+
+    def _poll_object_handle(self) -> Optional[int]:
+        """Return the first object handle on the camera, or None if there is none"""
+        # GetObjectHandles (storage_id=-1, format=0, parent=0)
+        code, params, data = self.send_command(
+            PTPOperation.GetObjectHandles,
+            [0xFFFFFFFF, 0x0000, 0x00000000]
+        )
+
+        if code != PTPResponseCode.OK:
+            raise IOError(f"GetObjectHandles failed: 0x{code:04X}")
+
+        # Parse object handles from data
+        if len(data) >= 8:
+            num_handles, handle = struct.unpack_from('<II', data, 0)
+            if num_handles > 0:
+                return handle
+
+        return None
+
+    def wait_for_result(self, timeout: int = 30, output: Optional[BinaryIO] = None) -> Union[bytearray, int]:
+        """
+        Wait for converted JPEG and download it
+
+        Waits for the camera's ObjectAdded event, polling GetObjectHandles
+        once per second as a fallback.
 
         Args:
             timeout: Maximum time to wait in seconds
+            output: Binary file to stream the JPEG into, instead of
+                collecting it in memory
 
         Returns:
-            JPEG data as bytes
+            JPEG data as a bytearray, or the JPEG size if output is given
         """
         print("[*] Waiting for conversion result", end='', flush=True)
 
+        # Progress dots are only for people watching, not for logs and pipes
+        show_progress = sys.stdout.isatty()
+
         start_time = time.time()
 
         while time.time() - start_time < timeout:
-            # GetObjectHandles (storage_id=-1, format=0, parent=0)
-            code, params, data = self.send_command(
-                PTPOperation.GetObjectHandles,
-                [0xFFFFFFFF, 0x0000, 0x00000000]
-            )
+            poll_start = time.time()
 
-            if code != PTPResponseCode.OK:
-                raise IOError(f"GetObjectHandles failed: 0x{code:04X}")
+            # Never wait past the caller's timeout
+            handle = self._wait_for_object_added(min(1.0, timeout - (poll_start - start_time)))
+            if handle is not None:
+                print(f"\n[+] Conversion complete! (handle=0x{handle:08X})")
+                code, result = self._get_object(handle, output)
 
-            # Parse object handles from data
-            if len(data) >= 4:
-                num_handles = struct.unpack('<I', data[:4])[0]
+                if code != PTPResponseCode.OK:
+                    # Stale event, ask the camera which object is there instead
+                    print(f"[!] GetObject failed for event handle 0x{handle:08X}: 0x{code:04X}, polling")
+                    handle = None
 
-                if num_handles > 0:
-                    # Extract first handle
-                    handle = struct.unpack('<I', data[4:8])[0]
+            if handle is None:
+                handle = self._poll_object_handle()
 
+                if handle is not None:
                     print(f"\n[+] Conversion complete! (handle=0x{handle:08X})")
-
-                    # Download object
-                    print("[*] Downloading JPEG...")
-                    code, params, jpeg_data = self.send_command(
-                        PTPOperation.GetObject,
-                        [handle]
-                    )
+                    code, result = self._get_object(handle, output)
 
                     if code != PTPResponseCode.OK:
                         raise IOError(f"GetObject failed: 0x{code:04X}")
 
-                    print(f"[+] Downloaded {len(jpeg_data)} bytes ({len(jpeg_data) / 1024 / 1024:.1f} MB)")
+            if handle is not None:
+                size = result if output is not None else len(result)
+                print(f"[+] Downloaded {size} bytes ({size / 1024 / 1024:.1f} MB)")
+
+                # Delete temp object
+                print("[*] Cleaning up temporary object...")
+                code, _, _ = self.send_command(
+                    PTPOperation.DeleteObject,
+                    [handle]
+                )
 
-                    # Delete temp object
-                    print("[*] Cleaning up temporary object...")
-                    code, _, _ = self.send_command(
-                        PTPOperation.DeleteObject,
-                        [handle]
-                    )
+                return result
 
-                    return jpeg_data
+            if show_progress:
+                print(".", end='', flush=True)
 
-            print(".", end='', flush=True)
-            time.sleep(1)
+            # Without events, keep polling once per second
+            now = time.time()
+            time.sleep(max(0.0, min(1.0 - (now - poll_start), timeout - (now - start_time))))
 
         raise TimeoutError(f"Conversion timeout after {timeout} seconds")